@@ -1,5 +1,5 @@
 import torch
-from transformers import CLIPTokenizer, PreTrainedTokenizerBase
+from transformers import CLIPTokenizer, CLIPTokenizerFast, PreTrainedTokenizerBase
 from typing import Tuple, Dict, Any, List, Optional
 import logging
 
@@ -9,6 +9,10 @@ logger = logging.getLogger(__name__)
 if not logging.getLogger().hasHandlers():
     logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(name)s - %(levelname)s - %(message)s')
 
+# Global cache for loaded tokenizers, keyed by Hugging Face name, to avoid
+# re-reading vocab/merges files from disk on every execution.
+_tokenizer_cache: Dict[str, PreTrainedTokenizerBase] = {}
+
 
 class CLIPTokenCounter:
     """
@@ -44,13 +48,42 @@ class CLIPTokenCounter:
     FUNCTION: str = "count_tokens"
     CATEGORY: str = "👽 Divergent Nodes/Text Utils" # Updated category slightly
 
-    # Removed __init__ as tokenizer loading is now handled per execution
+    # Removed __init__ as tokenizers are cached at module level
+
+    def _load_tokenizer(self, tokenizer_name: str) -> PreTrainedTokenizerBase:
+        """
+        Loads a tokenizer by name, using the module-level cache.
+
+        Prefers CLIPTokenizerFast and falls back to the Python CLIPTokenizer
+        if the fast variant cannot be loaded.
+
+        Args:
+            tokenizer_name: The Hugging Face name of the tokenizer to load.
+
+        Returns:
+            The loaded (or cached) tokenizer instance.
+        """
+        if tokenizer_name in _tokenizer_cache:
+            logger.debug(f"Using cached tokenizer: {tokenizer_name}")
+            return _tokenizer_cache[tokenizer_name]
+
+        logger.debug(f"Loading tokenizer: {tokenizer_name}")
+        tokenizer: PreTrainedTokenizerBase
+        try:
+            # Prefer the Rust-backed fast tokenizer
+            tokenizer = CLIPTokenizerFast.from_pretrained(tokenizer_name)
+        except Exception as e:
+            logger.warning(f"Fast tokenizer unavailable for '{tokenizer_name}' ({e}). Falling back to slow CLIPTokenizer.")
+            tokenizer = CLIPTokenizer.from_pretrained(tokenizer_name)
+        _tokenizer_cache[tokenizer_name] = tokenizer
+        return tokenizer
 
     def count_tokens(self, text: str, tokenizer_name: str) -> Tuple[int]:
         """
         Counts the number of CLIP tokens in the given text using the specified tokenizer.
 
-        Loads the tokenizer on demand. Handles empty input and tokenization errors.
+        Loads the tokenizer on first use and reuses it from the module-level
+        cache afterwards. Handles empty input and tokenization errors.
 
         Args:
             text: The text string to tokenize.
@@ -66,21 +99,18 @@ class CLIPTokenCounter:
             return (0,)
 
         try:
-            # Load tokenizer - consider caching if performance becomes an issue
-            # for frequently reused tokenizers within a single workflow execution.
-            # For now, load fresh each time for simplicity.
-            logger.debug(f"Loading tokenizer: {tokenizer_name}")
-            tokenizer: PreTrainedTokenizerBase = CLIPTokenizer.from_pretrained(tokenizer_name)
+            # Load tokenizer (cached after the first execution)
+            tokenizer: PreTrainedTokenizerBase = self._load_tokenizer(tokenizer_name)
 
             # Tokenize the input text
-            # padding=True ensures consistent shape if needed elsewhere,
             # truncation=True prevents errors with overly long text.
-            # return_tensors="pt" returns PyTorch tensors.
-            inputs = tokenizer(text, return_tensors="pt", padding=True, truncation=True)
+            # Only the length is needed, so keep the plain id list rather than
+            # building a (padded) PyTorch tensor.
+            inputs = tokenizer(text, truncation=True)
 
-            # The token count is the sequence length (dimension 1) of the input_ids tensor
+            # The token count is the length of the input_ids list
             # It includes special tokens (like BOS/EOS) added by the tokenizer.
-            token_count: int = inputs['input_ids'].shape[1]
+            token_count: int = len(inputs['input_ids'])
             logger.info(f"Tokenized text with '{tokenizer_name}'. Token count: {token_count}")
             return (token_count,)
 
@@ -19,7 +19,7 @@ from .gemini_utils import (
     SAFETY_SETTINGS_MAP,
     SAFETY_THRESHOLD_TO_NAME,
     ERROR_PREFIX,
-    google_exceptions # Import for exception handling
+    genai_errors # Import for exception handling
 )
 
 # Import shared utilities
@@ -199,9 +199,9 @@ class GeminiNode:
             final_output = response_error_msg if response_error_msg else generated_text
 
         # Handle potential Google API errors if sdk types were imported
-        except google_exceptions.GoogleAPIError as e:
-             # Check if google_exceptions was successfully imported before using it
-             if google_exceptions:
+        except genai_errors.APIError as e:
+             # Check if genai_errors was successfully imported before using it
+             if genai_errors:
                  error_msg = f"{ERROR_PREFIX} Google API Error - Status: {getattr(e, 'code', 'N/A')}, Message: {e}"
                  logger.error(error_msg, exc_info=True)
                  final_output = f"{ERROR_PREFIX} A Google API error occurred ({getattr(e, 'code', 'N/A')}). Check console logs."
@@ -12,7 +12,7 @@ from PIL import Image
 import torch
 from google import genai
 from google.genai import types
-from google.api_core import exceptions as google_exceptions
+from google.genai import errors as genai_errors # Errors raised by the google-genai SDK
 
 # Import the new config manager
 from ..shared_utils.config_manager import load_config
@@ -55,6 +55,13 @@ SAFETY_SETTINGS_MAP: Dict[str, str] = {
     "Block None": "BLOCK_NONE",
 }
 SAFETY_THRESHOLD_TO_NAME: Dict[str, str] = {v: k for k, v in SAFETY_SETTINGS_MAP.items()}
+# Harm categories, in the order the node passes its safety inputs
+SAFETY_CATEGORIES: Tuple[str, ...] = (
+    "HARM_CATEGORY_HARASSMENT",
+    "HARM_CATEGORY_HATE_SPEECH",
+    "HARM_CATEGORY_SEXUALLY_EXPLICIT",
+    "HARM_CATEGORY_DANGEROUS_CONTENT",
+)
 ERROR_PREFIX = "ERROR:"
 
 # --- Helper Functions ---
@@ -98,41 +105,17 @@ def prepare_safety_settings(safety_harassment: str, safety_hate_speech: str,
                              safety_sexually_explicit: str, safety_dangerous_content: str) -> List[types.SafetySetting]:
     """Builds the safety settings list from node inputs using types.SafetySetting and strings."""
     logger.debug("Preparing safety settings.")
-    settings = []
-    # Map string inputs to the string values expected by types.SafetySetting
-    category_map = {
-        "Harassment": "HARM_CATEGORY_HARASSMENT",
-        "Hate speech": "HARM_CATEGORY_HATE_SPEECH",
-        "Sexually explicit": "HARM_CATEGORY_SEXUALLY_EXPLICIT",
-        "Dangerous": "HARM_CATEGORY_DANGEROUS_CONTENT",
-    }
-    threshold_map = {
-        "Default (Unspecified)": "HARM_BLOCK_THRESHOLD_UNSPECIFIED",
-        "Block Low & Above": "BLOCK_LOW_AND_ABOVE",
-        "Block Medium & Above": "BLOCK_MEDIUM_AND_ABOVE",
-        "Block High Only": "BLOCK_ONLY_HIGH",
-        "Block None": "BLOCK_NONE",
-    }
-
-    # Use .get() with a default to handle potential missing keys gracefully
-    settings.append(types.SafetySetting(
-        category=category_map.get("Harassment", "HARM_CATEGORY_UNSPECIFIED"),
-        threshold=threshold_map.get(safety_harassment, "HARM_BLOCK_THRESHOLD_UNSPECIFIED")
-    ))
-    settings.append(types.SafetySetting(
-        category=category_map.get("Hate speech", "HARM_CATEGORY_UNSPECIFIED"),
-        threshold=threshold_map.get(safety_hate_speech, "HARM_BLOCK_THRESHOLD_UNSPECIFIED")
-    ))
-    settings.append(types.SafetySetting(
-        category=category_map.get("Sexually explicit", "HARM_CATEGORY_SEXUALLY_EXPLICIT"),
-        threshold=threshold_map.get(safety_sexually_explicit, "HARM_BLOCK_THRESHOLD_UNSPECIFIED")
-    ))
-    settings.append(types.SafetySetting(
-        category=category_map.get("Dangerous", "HARM_CATEGORY_DANGEROUS_CONTENT"),
-        threshold=threshold_map.get(safety_dangerous_content, "HARM_BLOCK_THRESHOLD_UNSPECIFIED")
-    ))
-
-    return settings
+    # Inputs are given in the same order as SAFETY_CATEGORIES
+    selected_thresholds = (safety_harassment, safety_hate_speech, safety_sexually_explicit, safety_dangerous_content)
+
+    # Use .get() with a default to handle potential unknown threshold names gracefully
+    return [
+        types.SafetySetting(
+            category=category,
+            threshold=SAFETY_SETTINGS_MAP.get(threshold_name, "HARM_BLOCK_THRESHOLD_UNSPECIFIED")
+        )
+        for category, threshold_name in zip(SAFETY_CATEGORIES, selected_thresholds)
+    ]
 
 def prepare_generation_config(temperature: float, top_p: float, top_k: int,
                                max_output_tokens: int) -> types.GenerateContentConfig:
@@ -288,8 +271,8 @@ def generate_content(
 
         final_output = generated_text if not response_error_msg else final_output
 
-    except google_exceptions.GoogleAPIError as e:
-         if google_exceptions:
+    except genai_errors.APIError as e:
+         if genai_errors:
              error_msg = f"{ERROR_PREFIX} Google API Error - Status: {getattr(e, 'code', 'N/A')}, Message: {e}"
              logger.error(error_msg, exc_info=True)
              final_output = f"{ERROR_PREFIX} A Google API error occurred ({getattr(e, 'code', 'N/A')}). Check console logs."
@@ -350,7 +333,7 @@ def get_available_models_robust(api_key: Optional[str]) -> List[str]:
         logger.info(f"Successfully fetched {len(model_list)} models from Gemini API.")
         return model_list
     
-    except google_exceptions.GoogleAPIError as e:
+    except genai_errors.APIError as e:
         error_msg = f"Error fetching Gemini models: {getattr(e, 'code', 'N/A')} {e.message}"
         logger.error(error_msg, exc_info=True)
         logger.warning("Failed to fetch models from Gemini API due to API error. Using default list.")
@@ -103,9 +103,12 @@ class SaveImageEnhancedNode:
 
         current_counter = initial_counter
 
-        for batch_number, image in enumerate(images):
-            i = 255. * image.cpu().numpy()
-            img = Image.fromarray(np.clip(i, 0, 255).astype(np.uint8))
+        # Convert the whole batch to uint8 in one pass (on the tensor's device)
+        # and copy it to the host once, instead of scaling/clipping per image.
+        images_np = images.mul(255.0).clamp_(0, 255).to(torch.uint8).cpu().numpy()
+
+        for batch_number, image_np in enumerate(images_np):
+            img = Image.fromarray(image_np)
 
             metadata = None
             if not args.disable_metadata:
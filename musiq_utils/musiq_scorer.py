@@ -3,6 +3,7 @@ import tensorflow_hub as hub
 from PIL import Image
 import numpy as np
 import logging
+import os
 
 # Configure logging for this module
 logger = logging.getLogger(__name__)
@@ -11,6 +12,15 @@ logger.setLevel(logging.INFO) # Set default logging level for this module
 # Global cache for MusiQ models to avoid re-downloading
 _musiq_model_cache = {}
 
+# TF Hub extracts models to a temp dir by default, which is often cleared between
+# sessions and forces a full re-download on cold start. Persist them under the user
+# cache instead (an explicit TFHUB_CACHE_DIR wins; DIVERGENT_NODES_WEIGHT_CACHE=0 disables).
+if os.environ.get("DIVERGENT_NODES_WEIGHT_CACHE", "1") == "1":
+    os.environ.setdefault(
+        "TFHUB_CACHE_DIR",
+        os.path.join(os.path.expanduser("~"), ".cache", "divergent_nodes", "tfhub_modules")
+    )
+
 class MusiQScorer:
     """
     Handles loading and interacting with the MusiQ TensorFlow Hub models (aesthetic and technical).
@@ -104,11 +104,9 @@ def assemble_image_grid(
 
         # Create background grid tensor on the same device as input images
         # Use float32 for the grid to ensure compatibility later
-        grid_tensor = torch.full((grid_height, grid_width, C), fill_value=bg_value[0] if C==1 else 0.0, dtype=torch.float32, device=device)
-        # Fill with tuple if multichannel
-        if C > 1:
-             for i in range(C):
-                  grid_tensor[..., i] = bg_value[i]
+        grid_tensor = torch.empty((grid_height, grid_width, C), dtype=torch.float32, device=device)
+        # Fill all channels in one broadcast write (scalar for grayscale, per-channel tuple otherwise)
+        grid_tensor[...] = torch.as_tensor(bg_value, dtype=torch.float32, device=device)
 
     except Exception as e:
         logger.error(f"Failed to create background grid tensor: {e}", exc_info=True)
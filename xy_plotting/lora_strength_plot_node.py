@@ -334,8 +334,9 @@ class LoraStrengthXYPlot:
                     continue
 
                 img_pil = Image.open(path).convert('RGB')
-                img_np = np.array(img_pil).astype(np.float32) / 255.0
-                img_tensor = torch.from_numpy(img_np).to(device) # Move to target device
+                img_np = np.array(img_pil) # uint8 [H, W, C]
+                # Move as uint8 and normalize in place on the target device
+                img_tensor = torch.from_numpy(img_np).to(device).float().div_(255.0)
                 loaded_tensors.append(img_tensor)
                 logger.debug(f"  Loaded image {i+1}/{len(image_paths)}: {path}")
             except Exception as e:
@@ -431,8 +432,11 @@ class LoraStrengthXYPlot:
                             img_index=img_idx, lora_filename_part=lora_filename_part
                         )
 
+                        # Copy to CPU once; reused for both saves and the preview
+                        img_tensor_cpu = img_tensor_hwc.float().cpu()
+
                         # Save to temporary file
-                        self._save_tensor_to_file(img_tensor_hwc, temp_filepath)
+                        self._save_tensor_to_file(img_tensor_cpu, temp_filepath)
                         generated_image_paths.append(temp_filepath)
 
                         # Save to permanent output folder if requested
@@ -440,13 +444,13 @@ class LoraStrengthXYPlot:
                             perm_filename = f"row-{y_idx}_col-{x_idx}_lora-{safe_lora_name}_str-{strength:.3f}.png"
                             perm_filepath = os.path.join(run_folder, perm_filename)
                             try:
-                                self._save_tensor_to_file(img_tensor_hwc, perm_filepath)
+                                self._save_tensor_to_file(img_tensor_cpu, perm_filepath)
                             except Exception as e_perm_save:
                                 logger.warning(f"Failed to save image to permanent location {perm_filepath}: {e_perm_save}")
                                 # Continue even if permanent save fails
 
-                        # Update last image for preview (move to CPU)
-                        last_image_tensor_cpu = img_tensor_hwc.cpu().clone()
+                        # Update last image for preview (already on CPU)
+                        last_image_tensor_cpu = img_tensor_cpu
 
                     except Exception as e_inner:
                          logger.error(f"Error processing image {img_idx} for cell ({y_idx},{x_idx}): {e_inner}", exc_info=True)
@@ -454,9 +458,10 @@ class LoraStrengthXYPlot:
                          # Placeholder should have been created by _generate_single_image
                          # If saving failed, path won't be added, grid assembly will handle missing files
                     finally:
-                         # Clean up GPU tensor immediately
+                         # Drop the GPU tensor reference; the caching allocator reuses its
+                         # block for the next (same-sized) tile, so the cache is only
+                         # emptied once after the loop instead of per cell.
                          del img_tensor_hwc
-                         comfy.model_management.soft_empty_cache()
 
             # --- Post-Loop Assembly ---
             if not generated_image_paths: